@@ -19,6 +19,7 @@ from datetime import datetime
 from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
 import json
 import os
+import re
 
 
 # Color palette
@@ -31,6 +32,18 @@ COLOR_WHITE = "#ffffff"
 COLOR_DARK_TEXT = "#212121"
 COLOR_SECONDARY_GRAY = "#757575"
 
+# Delay before live displays refresh after a keystroke, so fast typing
+# triggers one recalculation instead of one per key.
+RECALC_DELAY_MS = 150
+
+# Keystroke filter for dollar-amount entries: digits with an optional decimal point
+AMOUNT_PATTERN = re.compile(r"\d*\.?\d*")
+
+
+def format_currency(amount):
+    """Format a dollar amount as whole dollars, e.g. "$1,234"."""
+    return f"${int(amount):,}"
+
 
 class FMRDatabase:
     """Manages Fair Market Rent (FMR) data and Payment Standards."""
@@ -47,37 +60,62 @@ class FMRDatabase:
     def __init__(self):
         self.fmr_data = self.DEFAULT_FMR.copy()
         self.effective_date = "2025-01-01"
+        self.config_file = os.path.expanduser("~/.psh_fmr_data.json")
         self.load_from_file()
 
     def load_from_file(self):
         """Load FMR data from saved JSON file if it exists."""
-        config_file = os.path.expanduser("~/.psh_fmr_data.json")
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r') as f:
-                    data = json.load(f)
-                    self.fmr_data = {int(k): v for k, v in data.get("fmr_data", {}).items()}
-                    self.effective_date = data.get("effective_date", "2025-01-01")
-            except Exception as e:
-                print(f"Error loading FMR data: {e}")
+        # Open directly instead of probing with os.path.exists() first: one
+        # syscall fewer, and no race if the file disappears in between.
+        try:
+            with open(self.config_file, 'r') as f:
+                data = json.load(f)
+                self.fmr_data = {int(k): self.normalize_row(v)
+                                 for k, v in data.get("fmr_data", {}).items()}
+                self.effective_date = data.get("effective_date", "2025-01-01")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading FMR data: {e}")
 
     def save_to_file(self):
         """Save FMR data to JSON file."""
-        config_file = os.path.expanduser("~/.psh_fmr_data.json")
+        tmp_file = self.config_file + ".tmp"
         try:
-            with open(config_file, 'w') as f:
-                json.dump({
-                    "fmr_data": self.fmr_data,
-                    "effective_date": self.effective_date
-                }, f, indent=2)
+            content = json.dumps({
+                "fmr_data": self.fmr_data,
+                "effective_date": self.effective_date
+            }, indent=2)
+
+            # Nothing to do if the file already holds exactly this data
+            # (e.g. resetting a table that is already at the defaults).
+            try:
+                with open(self.config_file, 'r') as f:
+                    if f.read() == content:
+                        return
+            except OSError:
+                pass
+
+            # Write a temp file and rename it over the original, so a crash or
+            # full disk mid-write cannot leave a truncated settings file behind.
+            with open(tmp_file, 'w') as f:
+                f.write(content)
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             print(f"Error saving FMR data: {e}")
 
+    @staticmethod
+    def normalize_row(row):
+        """Coerce a payment standard / FMR row to whole-dollar ints."""
+        return {
+            "payment_standard": int(float(row.get("payment_standard", 0))),
+            "fmr": int(float(row.get("fmr", 0)))
+        }
+
     def get_fmr(self, bedrooms):
         """Get FMR for given bedroom count."""
-        if bedrooms in self.fmr_data:
-            return self.fmr_data[bedrooms]["fmr"]
-        return 0
+        row = self.fmr_data.get(bedrooms)
+        return row["fmr"] if row else 0
 
     def load_from_csv(self, filepath):
         """Load FMR data from CSV file."""
@@ -87,10 +125,7 @@ class FMRDatabase:
                 reader = csv.DictReader(f)
                 for row in reader:
                     bedrooms = int(row.get("bedrooms", 0))
-                    fmr_data[bedrooms] = {
-                        "payment_standard": int(float(row.get("payment_standard", 0))),
-                        "fmr": int(float(row.get("fmr", 0)))
-                    }
+                    fmr_data[bedrooms] = self.normalize_row(row)
             self.fmr_data = fmr_data
             self.effective_date = datetime.now().strftime("%Y-%m-%d")
             self.save_to_file()
@@ -174,6 +209,11 @@ class RentCalculationEngine:
                 prorated_hap = hap_to_owner
                 mixed_family_rent = tenant_rent
 
+            # Only stamp today's date when the caller did not supply one
+            calculation_date = inputs.get("calculation_date")
+            if calculation_date is None:
+                calculation_date = datetime.now().strftime("%m/%d/%Y")
+
             # Store results
             self.results = {
                 "head_of_household": inputs.get("head_of_household", ""),
@@ -185,7 +225,7 @@ class RentCalculationEngine:
                 "num_eligible": num_eligible,
                 "num_ineligible": num_ineligible,
                 "ha_staff": inputs.get("ha_staff", ""),
-                "calculation_date": inputs.get("calculation_date", datetime.now().strftime("%m/%d/%Y")),
+                "calculation_date": calculation_date,
 
                 # Calculated values
                 "gross_rent": gross_rent,
@@ -225,13 +265,11 @@ class PSHRentCalculatorApp:
     def __init__(self, root):
         self.root = root
         self.root.title("PSH Rent Calculator")
-        self.root.geometry("1000x750")
         self.root.configure(bg=COLOR_LIGHT_GRAY)
 
-        # Center window on screen
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        # Center window on screen. The size is fixed, so there is no need to
+        # force a geometry pass (update_idletasks) just to read it back.
+        width, height = 1000, 750
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f"{width}x{height}+{x}+{y}")
@@ -267,6 +305,10 @@ class PSHRentCalculatorApp:
         }
         self.current_results = {}
 
+        # Pending after() ids for debounced display refreshes, keyed by
+        # the update_*_display method they will run
+        self._pending_refresh = {}
+
         # Build UI
         self.build_ui()
 
@@ -406,8 +448,7 @@ class PSHRentCalculatorApp:
 
         self.voucher_var = tk.StringVar(value="0")
         voucher_combo = tk.Spinbox(form_frame, from_=0, to=5, textvariable=self.voucher_var,
-                                  font=("TkDefaultFont", 10), width=10,
-                                  command=self.update_fmr_display)
+                                  font=("TkDefaultFont", 10), width=10)
         voucher_combo.pack(anchor=tk.W, pady=(3, 15), ipady=5)
 
         # BR Leased
@@ -419,8 +460,7 @@ class PSHRentCalculatorApp:
 
         self.br_leased_var = tk.StringVar(value="0")
         br_combo = tk.Spinbox(form_frame, from_=0, to=5, textvariable=self.br_leased_var,
-                             font=("TkDefaultFont", 10), width=10,
-                             command=self.update_fmr_display)
+                             font=("TkDefaultFont", 10), width=10)
         br_combo.pack(anchor=tk.W, pady=(3, 15), ipady=5)
 
         # FMR info display
@@ -428,6 +468,11 @@ class PSHRentCalculatorApp:
                                        bg=COLOR_WHITE, fg=COLOR_SECONDARY_GRAY)
         self.fmr_info_label.pack(anchor=tk.W, padx=30, pady=(5, 15))
 
+        # Trace the variables rather than the Spinbox command so typed
+        # values refresh the FMR info too, not just arrow clicks.
+        self.voucher_var.trace_add("write", self.on_bedrooms_changed)
+        self.br_leased_var.trace_add("write", self.on_bedrooms_changed)
+
         self.update_fmr_display()
 
         # Navigation buttons
@@ -439,6 +484,11 @@ class PSHRentCalculatorApp:
                             padx=20, pady=8, relief=tk.FLAT, cursor="hand2")
         next_btn.pack(side=tk.RIGHT)
 
+    def on_bedrooms_changed(self, *args):
+        """Refresh FMR-dependent displays when voucher size or bedrooms change."""
+        self.update_fmr_display()
+        self.schedule_display(self.update_financial_display)
+
     def update_fmr_display(self):
         """Update FMR info display on step 1."""
         try:
@@ -467,6 +517,9 @@ class PSHRentCalculatorApp:
         form_frame = tk.Frame(frame, bg=COLOR_WHITE)
         form_frame.pack(fill=tk.X, padx=30, pady=10)
 
+        # Reject non-numeric keystrokes in the dollar-amount entries
+        amount_vcmd = (self.root.register(self.is_valid_amount), "%P")
+
         # Rent to Owner
         tk.Label(form_frame, text="Rent to Owner ($)", font=("TkDefaultFont", 10, "bold"),
                 bg=COLOR_WHITE, fg=COLOR_DARK_TEXT).pack(anchor=tk.W, pady=(10, 3))
@@ -475,9 +528,11 @@ class PSHRentCalculatorApp:
                 bg=COLOR_WHITE, fg=COLOR_SECONDARY_GRAY).pack(anchor=tk.W)
 
         self.rent_var = tk.StringVar(value="0")
-        rent_entry = tk.Entry(form_frame, textvariable=self.rent_var, font=("TkDefaultFont", 10), width=20)
+        rent_entry = tk.Entry(form_frame, textvariable=self.rent_var, font=("TkDefaultFont", 10), width=20,
+                             validate="key", validatecommand=amount_vcmd)
         rent_entry.pack(anchor=tk.W, pady=(3, 15), ipady=5)
-        rent_entry.bind("<KeyRelease>", lambda e: self.update_financial_display())
+        rent_entry.bind("<KeyRelease>", lambda e: self.schedule_display(self.update_financial_display))
+        rent_entry.bind("<FocusOut>", lambda e: self.flush_display(self.update_financial_display))
 
         # Utility Allowance
         tk.Label(form_frame, text="Utility Allowance ($)", font=("TkDefaultFont", 10, "bold"),
@@ -487,9 +542,11 @@ class PSHRentCalculatorApp:
                 bg=COLOR_WHITE, fg=COLOR_SECONDARY_GRAY).pack(anchor=tk.W)
 
         self.ua_var = tk.StringVar(value="0")
-        ua_entry = tk.Entry(form_frame, textvariable=self.ua_var, font=("TkDefaultFont", 10), width=20)
+        ua_entry = tk.Entry(form_frame, textvariable=self.ua_var, font=("TkDefaultFont", 10), width=20,
+                             validate="key", validatecommand=amount_vcmd)
         ua_entry.pack(anchor=tk.W, pady=(3, 15), ipady=5)
-        ua_entry.bind("<KeyRelease>", lambda e: self.update_financial_display())
+        ua_entry.bind("<KeyRelease>", lambda e: self.schedule_display(self.update_financial_display))
+        ua_entry.bind("<FocusOut>", lambda e: self.flush_display(self.update_financial_display))
 
         # TTP
         tk.Label(form_frame, text="Total Tenant Payment / TTP ($)", font=("TkDefaultFont", 10, "bold"),
@@ -499,9 +556,11 @@ class PSHRentCalculatorApp:
                 bg=COLOR_WHITE, fg=COLOR_SECONDARY_GRAY).pack(anchor=tk.W)
 
         self.ttp_var = tk.StringVar(value="50")
-        ttp_entry = tk.Entry(form_frame, textvariable=self.ttp_var, font=("TkDefaultFont", 10), width=20)
+        ttp_entry = tk.Entry(form_frame, textvariable=self.ttp_var, font=("TkDefaultFont", 10), width=20,
+                             validate="key", validatecommand=amount_vcmd)
         ttp_entry.pack(anchor=tk.W, pady=(3, 15), ipady=5)
-        ttp_entry.bind("<KeyRelease>", lambda e: self.update_financial_display())
+        ttp_entry.bind("<KeyRelease>", lambda e: self.schedule_display(self.update_financial_display))
+        ttp_entry.bind("<FocusOut>", lambda e: self.flush_display(self.update_financial_display))
 
         # Gross Rent display
         tk.Label(form_frame, text="Gross Rent (Rent + UA)", font=("TkDefaultFont", 10, "bold"),
@@ -516,6 +575,15 @@ class PSHRentCalculatorApp:
         self.fmr_comparison_frame = tk.Frame(frame, bg=COLOR_WHITE)
         self.fmr_comparison_frame.pack(fill=tk.X, padx=30, pady=10)
 
+        # Built once and re-laid out only when their text changes
+        self.fmr_compare_label = tk.Label(self.fmr_comparison_frame, text="",
+                                          font=("TkDefaultFont", 9),
+                                          bg=COLOR_WHITE, fg=COLOR_SECONDARY_GRAY)
+        self.fmr_warning_label = tk.Label(self.fmr_comparison_frame, text="",
+                                          font=("TkDefaultFont", 9), bg=COLOR_WARNING_RED,
+                                          fg=COLOR_WHITE, padx=8, pady=6, relief=tk.FLAT)
+        self._fmr_comparison_state = None
+
         # TTP warning
         self.ttp_warning_label = tk.Label(frame, text="", bg=COLOR_WARNING_YELLOW,
                                           fg=COLOR_DARK_TEXT, font=("TkDefaultFont", 9),
@@ -537,6 +605,25 @@ class PSHRentCalculatorApp:
                             padx=20, pady=8, relief=tk.FLAT, cursor="hand2")
         next_btn.pack(side=tk.RIGHT)
 
+    def is_valid_amount(self, proposed):
+        """Entry validatecommand: allow only a (possibly empty) dollar amount."""
+        return AMOUNT_PATTERN.fullmatch(proposed) is not None
+
+    def schedule_display(self, update):
+        """Run a display update once typing pauses (debounced)."""
+        pending = self._pending_refresh.pop(update, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        self._pending_refresh[update] = self.root.after(RECALC_DELAY_MS,
+                                                        lambda: self.flush_display(update))
+
+    def flush_display(self, update):
+        """Run a display update now, cancelling any pending debounced run."""
+        pending = self._pending_refresh.pop(update, None)
+        if pending is not None:
+            self.root.after_cancel(pending)
+        update()
+
     def update_financial_display(self):
         """Update financial displays in step 2."""
         try:
@@ -553,22 +640,23 @@ class PSHRentCalculatorApp:
             fmr_br = min(v_size, br)
             fmr = self.fmr_db.get_fmr(fmr_br)
 
-            # Update FMR comparison
-            for widget in self.fmr_comparison_frame.winfo_children():
-                widget.destroy()
-
-            if fmr > 0:
-                tk.Label(self.fmr_comparison_frame, text=f"FMR for {fmr_br}-BR: ${fmr:,}",
-                        font=("TkDefaultFont", 9),
-                        bg=COLOR_WHITE, fg=COLOR_SECONDARY_GRAY).pack(anchor=tk.W, pady=(5, 3))
-
+            # Update FMR comparison (skipped when nothing visible changed)
+            fmr_text = f"FMR for {fmr_br}-BR: ${fmr:,}" if fmr > 0 else ""
+            warning_text = ""
             if gross_rent > fmr:
                 diff = int(gross_rent - fmr)
-                warning_label = tk.Label(self.fmr_comparison_frame,
-                                        text=f"⚠ Gross Rent exceeds FMR by ${diff:,} — Supervisor approval required",
-                                        font=("TkDefaultFont", 9), bg=COLOR_WARNING_RED,
-                                        fg=COLOR_WHITE, padx=8, pady=6, relief=tk.FLAT)
-                warning_label.pack(anchor=tk.W, pady=(5, 0), fill=tk.X)
+                warning_text = f"⚠ Gross Rent exceeds FMR by ${diff:,} — Supervisor approval required"
+
+            if (fmr_text, warning_text) != self._fmr_comparison_state:
+                self._fmr_comparison_state = (fmr_text, warning_text)
+                self.fmr_compare_label.pack_forget()
+                self.fmr_warning_label.pack_forget()
+                if fmr_text:
+                    self.fmr_compare_label.config(text=fmr_text)
+                    self.fmr_compare_label.pack(anchor=tk.W, pady=(5, 3))
+                if warning_text:
+                    self.fmr_warning_label.config(text=warning_text)
+                    self.fmr_warning_label.pack(anchor=tk.W, pady=(5, 0), fill=tk.X)
 
             # TTP warning
             self.ttp_warning_label.pack_forget()
@@ -605,7 +693,8 @@ class PSHRentCalculatorApp:
                                   font=("TkDefaultFont", 10), width=10,
                                   command=self.update_family_display)
         eligible_spin.pack(anchor=tk.W, pady=(3, 15), ipady=5)
-        eligible_spin.bind("<KeyRelease>", lambda e: self.update_family_display())
+        eligible_spin.bind("<KeyRelease>", lambda e: self.schedule_display(self.update_family_display))
+        eligible_spin.bind("<FocusOut>", lambda e: self.flush_display(self.update_family_display))
 
         # Number Ineligible
         tk.Label(form_frame, text="Number Ineligible", font=("TkDefaultFont", 10, "bold"),
@@ -619,7 +708,8 @@ class PSHRentCalculatorApp:
                                     font=("TkDefaultFont", 10), width=10,
                                     command=self.update_family_display)
         ineligible_spin.pack(anchor=tk.W, pady=(3, 15), ipady=5)
-        ineligible_spin.bind("<KeyRelease>", lambda e: self.update_family_display())
+        ineligible_spin.bind("<KeyRelease>", lambda e: self.schedule_display(self.update_family_display))
+        ineligible_spin.bind("<FocusOut>", lambda e: self.flush_display(self.update_family_display))
 
         # Total Family Members
         tk.Label(form_frame, text="Total Family Members", font=("TkDefaultFont", 10, "bold"),
@@ -872,19 +962,19 @@ class PSHRentCalculatorApp:
 
         # HAP to Owner card
         hap_card = self.create_result_card(cards_frame, "HAP TO OWNER",
-                                          f"${int(r['hap_to_owner']):,}",
+                                          format_currency(r['hap_to_owner']),
                                           COLOR_SUCCESS_GREEN)
         hap_card.pack(side=tk.LEFT, expand=True, padx=5)
 
         # Tenant Rent card
         tenant_card = self.create_result_card(cards_frame, "TENANT RENT",
-                                             f"${int(r['tenant_rent']):,}",
+                                             format_currency(r['tenant_rent']),
                                              COLOR_PRIMARY_BLUE)
         tenant_card.pack(side=tk.LEFT, expand=True, padx=5)
 
         # Utility Reimbursement card
         utility_card = self.create_result_card(cards_frame, "UTILITY REIMB.",
-                                              f"${int(r['utility_reimbursement']):,}",
+                                              format_currency(r['utility_reimbursement']),
                                               COLOR_PRIMARY_BLUE)
         utility_card.pack(side=tk.LEFT, expand=True, padx=5)
 
@@ -894,7 +984,7 @@ class PSHRentCalculatorApp:
             above_fmr_frame.pack(fill=tk.X, padx=20, pady=10)
 
             tk.Label(above_fmr_frame,
-                    text=f"⚠ ABOVE FMR BY ${int(r['amount_above_fmr']):,} — SUPERVISOR APPROVAL REQUIRED",
+                    text=f"⚠ ABOVE FMR BY {format_currency(r['amount_above_fmr'])} — SUPERVISOR APPROVAL REQUIRED",
                     font=("TkDefaultFont", 10, "bold"), bg=COLOR_WARNING_RED,
                     fg=COLOR_WHITE).pack(padx=10, pady=10)
 
@@ -905,12 +995,12 @@ class PSHRentCalculatorApp:
 
             prorate_pct_display = float(r['prorate_pct']) * 100
             tk.Label(mixed_frame,
-                    text=f"MIXED FAMILY: Prorated HAP = ${int(r['prorated_hap']):,} ({prorate_pct_display:.1f}%)",
+                    text=f"MIXED FAMILY: Prorated HAP = {format_currency(r['prorated_hap'])} ({prorate_pct_display:.1f}%)",
                     font=("TkDefaultFont", 10, "bold"), bg=COLOR_WARNING_YELLOW,
                     fg=COLOR_DARK_TEXT).pack(anchor=tk.W, padx=10, pady=(8, 3))
 
             tk.Label(mixed_frame,
-                    text=f"Mixed Family Rent = ${int(r['mixed_family_rent']):,}",
+                    text=f"Mixed Family Rent = {format_currency(r['mixed_family_rent'])}",
                     font=("TkDefaultFont", 10), bg=COLOR_WARNING_YELLOW,
                     fg=COLOR_DARK_TEXT).pack(anchor=tk.W, padx=10, pady=(0, 8))
 
@@ -925,31 +1015,31 @@ class PSHRentCalculatorApp:
 
         # Build breakdown table
         breakdown_items = [
-            ("1", "Rent to Owner", f"${int(r['rent_to_owner']):,}"),
-            ("2", "Utility Allowance", f"${int(r['utility_allowance']):,}"),
-            ("3", "Gross Rent", f"${int(r['gross_rent']):,}"),
-            ("4", "2025 FMR", f"${int(r['fmr']):,}"),
-            ("5", "Lower of FMR or GR", f"${int(r['lower_fmr_or_gr']):,}"),
-            ("6", "Amount Above FMR", f"${int(r['amount_above_fmr']):,}", COLOR_WARNING_RED if r['amount_above_fmr'] > 0 else None),
-            ("7", "TTP ($50 Minimum)", f"${int(r['ttp']):,}"),
-            ("8", "Total HAP", f"${int(r['total_hap']):,}"),
-            ("9", "Total Family Share", f"${int(r['total_family_share']):,}"),
-            ("10", "HAP to Owner", f"${int(r['hap_to_owner']):,}", COLOR_SUCCESS_GREEN),
-            ("11", "Tenant Rent", f"${int(r['tenant_rent']):,}"),
-            ("12", "Utility Reimbursement", f"${int(r['utility_reimbursement']):,}"),
+            ("1", "Rent to Owner", format_currency(r['rent_to_owner'])),
+            ("2", "Utility Allowance", format_currency(r['utility_allowance'])),
+            ("3", "Gross Rent", format_currency(r['gross_rent'])),
+            ("4", "2025 FMR", format_currency(r['fmr'])),
+            ("5", "Lower of FMR or GR", format_currency(r['lower_fmr_or_gr'])),
+            ("6", "Amount Above FMR", format_currency(r['amount_above_fmr']), COLOR_WARNING_RED if r['amount_above_fmr'] > 0 else None),
+            ("7", "TTP ($50 Minimum)", format_currency(r['ttp'])),
+            ("8", "Total HAP", format_currency(r['total_hap'])),
+            ("9", "Total Family Share", format_currency(r['total_family_share'])),
+            ("10", "HAP to Owner", format_currency(r['hap_to_owner']), COLOR_SUCCESS_GREEN),
+            ("11", "Tenant Rent", format_currency(r['tenant_rent'])),
+            ("12", "Utility Reimbursement", format_currency(r['utility_reimbursement'])),
         ]
 
         # Proration section
         if r['is_mixed_family']:
             breakdown_items.append((None, "--- PRORATED ASSISTANCE ---", ""))
-            breakdown_items.append(("13", "Normal HAP", f"${int(r['hap_to_owner']):,}"))
+            breakdown_items.append(("13", "Normal HAP", format_currency(r['hap_to_owner'])))
             breakdown_items.append(("14", "Number Eligible", str(r['num_eligible'])))
             breakdown_items.append(("15", "Number Ineligible", str(r['num_ineligible'])))
             breakdown_items.append(("16", "Total Family Members", str(r['total_family_members'])))
             prorate_pct_pct = float(r['prorate_pct']) * 100
             breakdown_items.append(("17", "Prorate %", f"{prorate_pct_pct:.2f}%"))
-            breakdown_items.append(("18", "Prorated HAP", f"${int(r['prorated_hap']):,}"))
-            breakdown_items.append(("19", "Mixed Family Rent", f"${int(r['mixed_family_rent']):,}"))
+            breakdown_items.append(("18", "Prorated HAP", format_currency(r['prorated_hap'])))
+            breakdown_items.append(("19", "Mixed Family Rent", format_currency(r['mixed_family_rent'])))
         else:
             breakdown_items.append(("13", "Number Eligible", str(r['num_eligible'])))
             breakdown_items.append(("14", "Number Ineligible", str(r['num_ineligible'])))
@@ -1167,7 +1257,12 @@ class PSHRentCalculatorApp:
 
     def save_results(self):
         """Save results to text file."""
+        # Suggest a file name; keep only filename-safe characters from the name
+        hoh = "".join(c if c.isalnum() else "_"
+                      for c in self.current_results.get("head_of_household", "").strip())
+        default_name = f"PSH_Calculation_{hoh}_{datetime.now():%Y%m%d}.txt"
         filepath = filedialog.asksaveasfilename(defaultextension=".txt",
+                                               initialfile=default_name,
                                                filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
         if not filepath:
             return
@@ -1202,28 +1297,28 @@ class PSHRentCalculatorApp:
         lines.append("-" * 70)
         lines.append(f"Voucher Size (Bedrooms):        {r['voucher_size']}")
         lines.append(f"# Bedrooms Leased:              {r['br_leased']}")
-        lines.append(f"Rent to Owner:                  ${int(r['rent_to_owner']):,}")
-        lines.append(f"Utility Allowance:              ${int(r['utility_allowance']):,}")
-        lines.append(f"Total Tenant Payment (TTP):     ${int(r['ttp']):,}")
+        lines.append(f"Rent to Owner:                  {format_currency(r['rent_to_owner'])}")
+        lines.append(f"Utility Allowance:              {format_currency(r['utility_allowance'])}")
+        lines.append(f"Total Tenant Payment (TTP):     {format_currency(r['ttp'])}")
         lines.append("")
 
         lines.append("-" * 70)
         lines.append("RENT CALCULATION")
         lines.append("-" * 70)
-        lines.append(f"Gross Rent (Rent + UA):         ${int(r['gross_rent']):,}")
-        lines.append(f"Fair Market Rent (FMR):         ${int(r['fmr']):,}")
+        lines.append(f"Gross Rent (Rent + UA):         {format_currency(r['gross_rent'])}")
+        lines.append(f"Fair Market Rent (FMR):         {format_currency(r['fmr'])}")
 
         if r['amount_above_fmr'] > 0:
-            lines.append(f"Amount Above FMR:               ${int(r['amount_above_fmr']):,} [SUPERVISOR APPROVAL REQUIRED]")
+            lines.append(f"Amount Above FMR:               {format_currency(r['amount_above_fmr'])} [SUPERVISOR APPROVAL REQUIRED]")
         else:
-            lines.append(f"Amount Above FMR:               ${int(r['amount_above_fmr']):,}")
+            lines.append(f"Amount Above FMR:               {format_currency(r['amount_above_fmr'])}")
 
         lines.append("")
-        lines.append(f"Total HAP (Gross Rent - TTP):   ${int(r['total_hap']):,}")
-        lines.append(f"Total Family Share (TTP):       ${int(r['total_family_share']):,}")
-        lines.append(f"HAP to Owner:                   ${int(r['hap_to_owner']):,}")
-        lines.append(f"Tenant Rent to Owner:           ${int(r['tenant_rent']):,}")
-        lines.append(f"Utility Reimbursement:          ${int(r['utility_reimbursement']):,}")
+        lines.append(f"Total HAP (Gross Rent - TTP):   {format_currency(r['total_hap'])}")
+        lines.append(f"Total Family Share (TTP):       {format_currency(r['total_family_share'])}")
+        lines.append(f"HAP to Owner:                   {format_currency(r['hap_to_owner'])}")
+        lines.append(f"Tenant Rent to Owner:           {format_currency(r['tenant_rent'])}")
+        lines.append(f"Utility Reimbursement:          {format_currency(r['utility_reimbursement'])}")
         lines.append("")
 
         if r['is_mixed_family']:
@@ -1235,8 +1330,8 @@ class PSHRentCalculatorApp:
             lines.append(f"Total Family Members:           {r['total_family_members']}")
             prorate_pct = float(r['prorate_pct']) * 100
             lines.append(f"Prorate Percentage:             {prorate_pct:.2f}%")
-            lines.append(f"Prorated HAP:                   ${int(r['prorated_hap']):,}")
-            lines.append(f"Mixed Family Rent:              ${int(r['mixed_family_rent']):,}")
+            lines.append(f"Prorated HAP:                   {format_currency(r['prorated_hap'])}")
+            lines.append(f"Mixed Family Rent:              {format_currency(r['mixed_family_rent'])}")
             lines.append("")
 
         lines.append("=" * 70)
@@ -36,7 +36,10 @@ same whole-dollar results. If you change the calculation in any one of the
 three implementations, change all three and re-run this file.
 """
 
+import json
+import os
 import sys
+import tempfile
 import types
 import unittest
 from decimal import Decimal
@@ -185,5 +188,53 @@ class TestRentCalculationEngine(unittest.TestCase):
         self.assertLessEqual(r["tenant_rent"], r["rent_to_owner"])
 
 
+class TestFMRDatabase(unittest.TestCase):
+    def test_saved_values_load_as_whole_dollars(self):
+        # A hand-edited settings file with float values must not leak
+        # "2485.0"-style numbers into the FMR displays.
+        with tempfile.TemporaryDirectory() as tmp:
+            db = psh.FMRDatabase()
+            db.config_file = os.path.join(tmp, "fmr.json")
+            with open(db.config_file, "w") as f:
+                json.dump({"fmr_data": {"1": {"payment_standard": 3275.0, "fmr": "2977.0"}},
+                           "effective_date": "2026-01-01"}, f)
+            db.load_from_file()
+            self.assertEqual(db.fmr_data, {1: {"payment_standard": 3275, "fmr": 2977}})
+            self.assertIsInstance(db.get_fmr(1), int)
+            self.assertEqual(db.get_fmr(2), 0)
+            self.assertEqual(db.effective_date, "2026-01-01")
+
+    def test_save_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = psh.FMRDatabase()
+            db.config_file = os.path.join(tmp, "fmr.json")
+            db.fmr_data = psh.FMRDatabase.DEFAULT_FMR.copy()
+            db.effective_date = "2026-01-01"
+            db.save_to_file()
+            self.assertEqual(os.listdir(tmp), ["fmr.json"])  # no temp file left behind
+
+            loaded = psh.FMRDatabase()
+            loaded.config_file = db.config_file
+            loaded.load_from_file()
+            self.assertEqual(loaded.fmr_data, psh.FMRDatabase.DEFAULT_FMR)
+            self.assertEqual(loaded.effective_date, "2026-01-01")
+
+    def test_unchanged_save_skips_rewrite(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = psh.FMRDatabase()
+            db.config_file = os.path.join(tmp, "fmr.json")
+            db.fmr_data = psh.FMRDatabase.DEFAULT_FMR.copy()
+            db.save_to_file()
+            inode = os.stat(db.config_file).st_ino
+
+            db.save_to_file()  # same data: file must not be replaced
+            self.assertEqual(os.stat(db.config_file).st_ino, inode)
+
+            db.effective_date = "2026-01-01"
+            db.save_to_file()
+            with open(db.config_file) as f:
+                self.assertEqual(json.load(f)["effective_date"], "2026-01-01")
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)